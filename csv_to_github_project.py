@@ -1,91 +1,287 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import csv
+import json
+import logging
+import logging.handlers
 import os
+import re
 import sys
 import time
-from typing import Dict, Any, List, Optional
-import requests
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Optional, Sequence, Tuple
+import httpx
+
+try:
+    # opțional: serializare JSON mult mai rapidă (pip install orjson)
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    json_loads = json.loads
 
 GQL_ENDPOINT = "https://api.github.com/graphql"
 
-def gql(token: str, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
-    r = requests.post(
-        GQL_ENDPOINT,
-        json={"query": query, "variables": variables},
+log = logging.getLogger("csv2proj")
+
+def setup_logging(level: int = logging.INFO) -> None:
+    """Progresul merge pe stdout prin buffer (fără flush la fiecare linie),
+    avertismentele și erorile direct pe stderr."""
+    logging.addLevelName(logging.WARNING, "AVERTISMENT")
+    logging.addLevelName(logging.ERROR, "EROARE")
+    out = logging.StreamHandler(sys.stdout)
+    out.setFormatter(logging.Formatter("%(message)s"))
+    buffered = logging.handlers.MemoryHandler(capacity=64, flushLevel=logging.CRITICAL, target=out)
+    buffered.addFilter(lambda record: record.levelno < logging.WARNING)
+    err = logging.StreamHandler(sys.stderr)
+    err.setLevel(logging.WARNING)
+    err.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    log.addHandler(buffered)
+    log.addHandler(err)
+    log.setLevel(level)
+    log.propagate = False
+
+def make_client() -> httpx.AsyncClient:
+    # un singur client HTTP/2 pentru tot importul: toate request-urile concurente sunt
+    # multiplexate pe aceeași conexiune TLS la api.github.com
+    return httpx.AsyncClient(
         headers={
-            "Authorization": f"Bearer {token}",
             "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
             # necesar ca să fie disponibile Projects v2 mutations (ex: createProjectV2DraftIssue)
             "GraphQL-Features": "projects_next_graphql",
         },
-        timeout=60,
+        timeout=60.0,
+        # reîncearcă erorile de conectare; erorile HTTP sunt tratate în gql()
+        transport=httpx.AsyncHTTPTransport(http2=True, retries=3,
+                                           limits=httpx.Limits(max_connections=1, max_keepalive_connections=1)),
     )
+
+SERVER_ERRORS = (502, 503, 504)
+RETRY_STATUSES = (429,) + SERVER_ERRORS
+
+class RateLimiter:
+    """Ritmul request-urilor, comun pentru toate rândurile procesate concurent.
+
+    Se bazează pe X-RateLimit-Remaining / X-RateLimit-Reset din răspunsuri: cât timp
+    bugetul rămas acoperă timpul până la reset nu se așteaptă deloc; sub acest prag
+    request-urile sunt distribuite uniform până la reset. Retry-After (limita
+    secundară) blochează toate request-urile pentru durata cerută.
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval = min_interval
+        self.remaining: Optional[int] = None
+        self.reset: Optional[float] = None
+        self.blocked_until = 0.0
+        self.next_slot = 0.0
+
+    async def acquire(self) -> None:
+        # fără await între citire și rezervarea slotului, deci nu e nevoie de lock
+        now = time.time()
+        delay = 0.0
+        if self.remaining is not None and self.reset is not None:
+            window = max(0.0, self.reset - now)
+            if window > self.remaining:
+                delay = window / max(1, self.remaining)
+        start = max(now, self.next_slot, self.blocked_until)
+        self.next_slot = start + max(self.min_interval, delay)
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def update(self, headers: Any) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is not None and reset is not None:
+            self.remaining = int(remaining)
+            self.reset = float(reset)
+
+    def block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.time() + seconds)
+
+RATE_LIMITER = RateLimiter()
+
+class GraphQLError(RuntimeError):
+    """GitHub a răspuns, dar a respins documentul (errors în body), ex: o valoare invalidă."""
+
+async def gql(client: httpx.AsyncClient, token: str, query: str, variables: Dict[str, Any],
+              max_attempts: int = 5, allow_not_found: bool = False,
+              idempotent: bool = True) -> Dict[str, Any]:
+    body = json_dumps({"query": query, "variables": variables})
+    data: Dict[str, Any] = {}
+    for attempt in range(1, max_attempts + 1):
+        await RATE_LIMITER.acquire()
+        r = await client.post(
+            GQL_ENDPOINT,
+            content=body,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        RATE_LIMITER.update(r.headers)
+        last = attempt == max_attempts
+        if r.status_code in (403, 429) and not last:
+            # limita secundară: GitHub spune cât să așteptăm; limita primară: până la reset
+            retry_after = r.headers.get("Retry-After")
+            if retry_after is not None:
+                RATE_LIMITER.block(float(retry_after))
+                continue
+            if r.headers.get("X-RateLimit-Remaining") == "0" and r.headers.get("X-RateLimit-Reset"):
+                RATE_LIMITER.block(float(r.headers["X-RateLimit-Reset"]) - time.time() + 1)
+                continue
+            # limita secundară fără Retry-After: GitHub cere cel puțin un minut de pauză
+            if "secondary rate limit" in r.text.lower():
+                RATE_LIMITER.block(60)
+                continue
+        # un 502/504 poate veni după ce o mutație lentă a fost deja aplicată; mutațiile care
+        # creează ceva (idempotent=False) nu se retrimit, altfel ar apărea duplicate
+        if r.status_code in RETRY_STATUSES and not last and (idempotent or r.status_code == 429):
+            await asyncio.sleep(0.5 * 2 ** (attempt - 1))
+            continue
+        if r.status_code == 200:
+            data = json_loads(r.content)
+            # limita primară la GraphQL poate veni și ca HTTP 200 cu errors[].type RATE_LIMITED;
+            # operația nu a fost executată, deci se poate retrimite după reset
+            if not last and any(e.get("type") == "RATE_LIMITED" for e in data.get("errors") or []):
+                reset = r.headers.get("X-RateLimit-Reset")
+                RATE_LIMITER.block(float(reset) - time.time() + 1 if reset else 60)
+                continue
+        break
+    if r.status_code in SERVER_ERRORS and not idempotent:
+        raise RuntimeError(f"GraphQL HTTP {r.status_code}: elementul poate să fi fost creat totuși; "
+                           f"verifică în GitHub înainte de a rula din nou rândul.")
     if r.status_code != 200:
         raise RuntimeError(f"GraphQL HTTP {r.status_code}: {r.text}")
-    data = r.json()
-    if "errors" in data:
-        raise RuntimeError(f"GraphQL errors: {data['errors']}")
-    return data["data"]
-
-
-def get_project_and_fields(token: str, owner: str, number: int) -> Dict[str, Any]:
-    q_user = """
-    query($owner:String!, $number:Int!) {
-      user(login:$owner) {
-        projectV2(number:$number) {
-          id
-          fields(first: 100) {
-            nodes {
-              __typename
-              ... on ProjectV2FieldCommon { id name dataType }
-              ... on ProjectV2SingleSelectField { id name dataType options { id name } }
-              ... on ProjectV2IterationField { id name dataType }
-            }
-          }
-        }
-      }
-    }
+    errors = data.get("errors")
+    if errors and not (allow_not_found and all(e.get("type") == "NOT_FOUND" for e in errors)):
+        raise GraphQLError(f"GraphQL errors: {data['errors']}")
+    return data.get("data") or {}
+
+_VAR_RE = re.compile(r"\$(\w+)")
+_ROOT_FIELD_RE = re.compile(r"^\s*(\w+)")
+
+async def gql_batch(client: httpx.AsyncClient, token: str, ops: List[Tuple[str, str, Dict[str, Any]]],
+                    allow_not_found: bool = False) -> List[Any]:
+    """Trimite mai multe query-uri într-un singur request HTTP.
+
+    Fiecare operație e un tuplu (definiții variabile, selecție root, variabile), ex:
+    ("$login:String!", "user(login:$login){ id }", {"login": "octocat"}).
+    Variabilele și câmpurile root primesc prefixul gatsby0_, gatsby1_ ... ca să nu se
+    ciocnească; rezultatul e lista răspunsurilor, în ordinea operațiilor.
+    Cu allow_not_found=True, operațiile fără rezultat (NOT_FOUND) întorc None în loc
+    să oprească tot request-ul.
     """
-    q_org = """
-    query($owner:String!, $number:Int!) {
-      organization(login:$owner) {
-        projectV2(number:$number) {
-          id
-          fields(first: 100) {
-            nodes {
-              __typename
-              ... on ProjectV2FieldCommon { id name dataType }
-              ... on ProjectV2SingleSelectField { id name dataType options { id name } }
-              ... on ProjectV2IterationField { id name dataType }
-            }
-          }
-        }
-      }
+    if not ops:
+        return []
+    defs: List[str] = []
+    selections: List[str] = []
+    variables: Dict[str, Any] = {}
+    aliases: List[str] = []
+    for i, (var_defs, selection, op_vars) in enumerate(ops):
+        prefix = f"gatsby{i}_"
+        alias = prefix + _ROOT_FIELD_RE.match(selection).group(1)
+        aliases.append(alias)
+        if var_defs:
+            defs.append(_VAR_RE.sub(lambda mt: f"${prefix}{mt.group(1)}", var_defs))
+        selections.append(f"{alias}: " + _VAR_RE.sub(lambda mt: f"${prefix}{mt.group(1)}", selection))
+        for k, v in op_vars.items():
+            variables[prefix + k] = v
+    head = f"query({', '.join(defs)})" if defs else "query"
+    doc = head + " {\n  " + "\n  ".join(selections) + "\n}"
+    d = await gql(client, token, doc, variables, allow_not_found=allow_not_found)
+    return [d.get(a) for a in aliases]
+
+
+# Query-urile și mutațiile sunt constante de modul: string-urile se construiesc o singură
+# dată, nu la fiecare apel din bucla pe rânduri.
+# user și organization în același document: pentru login-ul care nu se potrivește GitHub
+# întoarce null (plus o eroare NOT_FOUND), deci un singur request acoperă ambele cazuri
+Q_PROJECT = """
+query($owner:String!, $number:Int!) {
+  user(login:$owner) { projectV2(number:$number) { ...ProjectFields } }
+  organization(login:$owner) { projectV2(number:$number) { ...ProjectFields } }
+}
+fragment ProjectFields on ProjectV2 {
+  id
+  fields(first: 100) {
+    nodes {
+      __typename
+      ... on ProjectV2FieldCommon { id name dataType }
+      ... on ProjectV2SingleSelectField { id name dataType options { id name } }
+      ... on ProjectV2IterationField { id name dataType }
     }
-    """
-
-    # 1) încearcă user
-    try:
-        d = gql(token, q_user, {"owner": owner, "number": number})
-        user_proj = (d.get("user") or {}).get("projectV2")
-    except RuntimeError:
-        user_proj = None
-
-    proj = user_proj
-    where = "user"
-
-    # 2) dacă nu e user, încearcă organization
-    if not proj:
-        d = gql(token, q_org, {"owner": owner, "number": number})
-        proj = (d.get("organization") or {}).get("projectV2")
-        where = "org"
+  }
+}
+"""
+
+Q_REPO_ID = """
+query($owner:String!, $name:String!) {
+  repository(owner:$owner, name:$name){ id }
+}
+"""
+
+Q_LABELS = """
+query($owner:String!, $name:String!, $cursor:String) {
+  repository(owner:$owner, name:$name){
+    labels(first:100, after:$cursor){
+      nodes { id name }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# issue-ul e adăugat în Project direct prin projectV2Ids, iar item-ul rezultat e citit din
+# același răspuns: o singură mutație în loc de createIssue + addProjectV2ItemById
+M_CREATE_AND_ADD = """
+mutation($input:CreateIssueInput!){
+  createIssue(input:$input){
+    issue {
+      id number url
+      projectItems(first: 20) { nodes { id project { id } } }
+    }
+  }
+}
+"""
+
+M_ADD_ITEM = """
+mutation($projectId:ID!, $contentId:ID!){
+  addProjectV2ItemById(input:{projectId:$projectId, contentId:$contentId}){
+    item { id }
+  }
+}
+"""
+
+M_DRAFT_ISSUE = """
+mutation($input:AddProjectV2DraftIssueInput!){
+  addProjectV2DraftIssue(input:$input){
+    projectItem { id }
+  }
+}
+"""
+
+# operație pentru gql_batch: (definiții variabile, selecție root)
+Q_USER = ("$login:String!", "user(login:$login){ id login }")
+
+# o mutație per câmp, cu $p / $i comune; {n} e indexul câmpului în document
+M_UPDATE_FIELD = "m{n}: updateProjectV2ItemFieldValue(input:{{projectId:$p, itemId:$i, fieldId:$f{n}, value:$v{n}}}){{ projectV2Item {{ id }} }}"
+
+
+async def get_project_and_fields(client: httpx.AsyncClient, token: str, owner: str, number: int) -> Dict[str, Any]:
+    d = await gql(client, token, Q_PROJECT, {"owner": owner, "number": number}, allow_not_found=True)
+    user_proj = (d.get("user") or {}).get("projectV2")
+    org_proj = (d.get("organization") or {}).get("projectV2")
+    proj = org_proj or user_proj
+    where = "org" if org_proj else "user"
 
     if not proj:
         raise RuntimeError(f"Nu am găsit Project #{number} la '{owner}' (nici ca user, nici ca organization).")
 
     # opțional, mesaj de debug
-    print(f"[INFO] Project găsit la {where}.")
+    log.info("Project găsit la %s.", where)
 
     # Normalizează câmpurile într-un dict by-name
     field_by_name: Dict[str, Any] = {}
@@ -99,157 +295,264 @@ def get_project_and_fields(token: str, owner: str, number: int) -> Dict[str, Any
         }
         if node.get("__typename") == "ProjectV2SingleSelectField":
             field["options"] = node.get("options", []) or []
+            # lookup O(1) după numele opțiunii, fără diferență între majuscule/minuscule
+            field["options_by_lower"] = {o["name"].lower(): o["id"] for o in field["options"]}
+        field["build_value"] = make_value_builder(field)
         field_by_name[field["name"]] = field
 
     return {"id": proj["id"], "fields": field_by_name}
 
 
-def get_repo_id(token: str, repo_full: str) -> str:
+async def get_repo_id(client: httpx.AsyncClient, token: str, repo_full: str) -> str:
     owner, name = repo_full.split("/", 1)
-    q = """
-    query($owner:String!, $name:String!) {
-      repository(owner:$owner, name:$name){ id }
-    }
-    """
-    d = gql(token, q, {"owner": owner, "name": name})
+    d = await gql(client, token, Q_REPO_ID, {"owner": owner, "name": name})
     repo = d["repository"]
     if not repo:
         raise RuntimeError(f"Repository-ul {repo_full} nu există sau nu ai acces.")
     return repo["id"]
 
-def get_label_ids(token: str, repo_full: str, label_names: List[str]) -> List[str]:
+# cache-uri în proces: aceleași etichete / persoane apar de obicei pe multe rânduri,
+# așa că nimic nu e căutat în GitHub de două ori (None = utilizator inexistent)
+_REPO_LABELS: Dict[str, Dict[str, str]] = {}
+_USER_IDS: Dict[str, Optional[str]] = {}
+
+async def load_repo_labels(client: httpx.AsyncClient, token: str, repo_full: str) -> Dict[str, str]:
+    """Încarcă o singură dată toate etichetele repo-ului, ca {nume lowercase: id}."""
+    if repo_full in _REPO_LABELS:
+        return _REPO_LABELS[repo_full]
+    owner, name = repo_full.split("/", 1)
+    labels: Dict[str, str] = {}
+    cursor = None
+    while True:
+        d = await gql(client, token, Q_LABELS, {"owner": owner, "name": name, "cursor": cursor})
+        page = d["repository"]["labels"]
+        for x in page["nodes"]:
+            labels[x["name"].lower()] = x["id"]
+        if not page["pageInfo"]["hasNextPage"]:
+            break
+        cursor = page["pageInfo"]["endCursor"]
+    _REPO_LABELS[repo_full] = labels
+    return labels
+
+async def get_label_ids(client: httpx.AsyncClient, token: str, repo_full: str,
+                        label_names: Sequence[str], line: int) -> List[str]:
     if not label_names:
         return []
-    owner, name = repo_full.split("/", 1)
-    q = """
-    query($owner:String!, $name:String!, $query:String!) {
-      repository(owner:$owner, name:$name){
-        labels(first:100, query:$query){ nodes { id name } }
-      }
-    }
-    """
-    ids = []
-    remaining = set([ln.strip() for ln in label_names if ln.strip()])
-    # o singură interogare cu query gol ia primele 100; ca să acoperim orice, rulăm pe fiecare nume
-    for ln in list(remaining):
-        d = gql(token, q, {"owner": owner, "name": name, "query": ln})
-        nodes = d["repository"]["labels"]["nodes"]
-        match = next((x for x in nodes if x["name"].lower() == ln.lower()), None)
-        if match:
-            ids.append(match["id"])
-            remaining.discard(ln)
+    m = await load_repo_labels(client, token, repo_full)
+    names = sorted({ln.strip() for ln in label_names if ln.strip()})
+    remaining = [n for n in names if n.lower() not in m]
     if remaining:
-        print(f"[AVERTISMENT] Etichete inexistente în repo: {', '.join(sorted(remaining))}", file=sys.stderr)
-    return ids
+        log.warning("Linia %d: etichete inexistente în repo: %s", line, ", ".join(remaining))
+    return [m[n.lower()] for n in names if n.lower() in m]
 
-def get_user_ids(token: str, logins: List[str]) -> List[str]:
+async def get_user_ids(client: httpx.AsyncClient, token: str, logins: Sequence[str],
+                       line: int) -> List[str]:
     if not logins:
         return []
-    q = """
-    query($login:String!){ user(login:$login){ id login } }
-    """
-    ids = []
-    for lg in {x.strip() for x in logins if x.strip()}:
-        d = gql(token, q, {"login": lg})
-        u = d.get("user")
-        if u:
-            ids.append(u["id"])
-        else:
-            print(f"[AVERTISMENT] Utilizator inexistent: {lg}", file=sys.stderr)
-    return ids
-
-def create_issue(token: str, repo_id: str, title: str, body: str,
-                 label_ids: List[str], assignee_ids: List[str]) -> str:
-    m = """
-    mutation($input:CreateIssueInput!){
-      createIssue(input:$input){
-        issue { id number url }
-      }
-    }
-    """
-    d = gql(token, m, {"input": {
+    logins = sorted({x.strip() for x in logins if x.strip()})
+    missing = [lg for lg in logins if lg.lower() not in _USER_IDS]
+    # un login inexistent întoarce user: null + eroare NOT_FOUND; nu trebuie să strice
+    # căutarea celorlalte login-uri din același request
+    results = await gql_batch(client, token, [
+        (*Q_USER, {"login": lg}) for lg in missing
+    ], allow_not_found=True)
+    for lg, u in zip(missing, results):
+        _USER_IDS[lg.lower()] = u["id"] if u else None
+    ids = [_USER_IDS[lg.lower()] for lg in logins]
+    for lg, uid in zip(logins, ids):
+        if uid is None:
+            log.warning("Linia %d: utilizator inexistent: %s", line, lg)
+    return [uid for uid in ids if uid]
+
+async def create_issue_and_item(client: httpx.AsyncClient, token: str, repo_id: str, project_id: str,
+                                title: str, body: str, label_ids: List[str], assignee_ids: List[str],
+                                line: int) -> str:
+    d = await gql(client, token, M_CREATE_AND_ADD, {"input": {
         "repositoryId": repo_id,
         "title": title,
         "body": body or "",
         "labelIds": label_ids or None,
-        "assigneeIds": assignee_ids or None
-    }})
+        "assigneeIds": assignee_ids or None,
+        "projectV2Ids": [project_id],
+    }}, idempotent=False)
     issue = d["createIssue"]["issue"]
-    print(f"Creat issue #{issue['number']}: {issue['url']}")
-    return issue["id"]
-
-def add_item_to_project(token: str, project_id: str, content_id: str) -> str:
-    m = """
-    mutation($projectId:ID!, $contentId:ID!){
-      addProjectV2ItemById(input:{projectId:$projectId, contentId:$contentId}){
-        item { id }
-      }
-    }
-    """
-    d = gql(token, m, {"projectId": project_id, "contentId": content_id})
+    log.info("Linia %d: creat issue #%d: %s", line, issue["number"], issue["url"])
+    item_id = next((x["id"] for x in issue["projectItems"]["nodes"]
+                    if x and x["project"]["id"] == project_id), None)
+    if item_id is None:
+        # item-ul nu apare în răspuns (ex: propagare întârziată); îl adăugăm explicit
+        item_id = await add_item_to_project(client, token, project_id, issue["id"])
+    return item_id
+
+async def add_item_to_project(client: httpx.AsyncClient, token: str, project_id: str,
+                              content_id: str) -> str:
+    d = await gql(client, token, M_ADD_ITEM, {"projectId": project_id, "contentId": content_id})
     return d["addProjectV2ItemById"]["item"]["id"]
 
-def update_field(token: str, project_id: str, item_id: str,
-                 field_id: str, data_type: str, value: str, options: Optional[List[Dict[str,str]]] = None):
-    # detect value payload by type
-    val: Dict[str, Any]
+def make_value_builder(field: Dict[str, Any]) -> Callable[[str], Dict[str, Any]]:
+    """Construiește o singură dată, după tipul câmpului, funcția care transformă valoarea
+    din CSV în payload-ul pentru updateProjectV2ItemFieldValue. Pentru valori care trebuie
+    ignorate aruncă ValueError cu motivul; process_row îl raportează cu linia și coloana."""
+    data_type = field["dataType"]
     if data_type == "TEXT":
-        val = {"text": value}
-    elif data_type == "NUMBER":
-        # try to coerce to number
-        try:
-            num = float(value)
-        except ValueError:
-            print(f"[AVERTISMENT] Câmp numeric ignorat (valoare invalidă): {value}", file=sys.stderr)
-            return
-        val = {"number": num}
-    elif data_type == "DATE":
+        return lambda value: {"text": value}
+    if data_type == "NUMBER":
+        def build_number(value: str) -> Dict[str, Any]:
+            # try to coerce to number
+            try:
+                return {"number": float(value)}
+            except ValueError:
+                raise ValueError(f"câmp numeric ignorat (valoare invalidă): {value}") from None
+        return build_number
+    if data_type == "DATE":
         # GitHub așteaptă YYYY-MM-DD
-        val = {"date": value}
-    elif data_type == "SINGLE_SELECT":
-        if not options:
-            print(f"[AVERTISMENT] Câmp single-select fără opțiuni; ignorat.", file=sys.stderr)
-            return
-        opt = next((o for o in options if o["name"].lower() == value.lower()), None)
-        if not opt:
-            print(f"[AVERTISMENT] Opțiune necunoscută '{value}' pentru câmpul single-select; ignorat.", file=sys.stderr)
-            return
-        val = {"singleSelectOptionId": opt["id"]}
-    else:
-        print(f"[INFO] Tip de câmp nesuportat acum: {data_type}; ignor.", file=sys.stderr)
-        return
-
-    m = """
-    mutation($input:UpdateProjectV2ItemFieldValueInput!){
-      updateProjectV2ItemFieldValue(input:$input){ projectV2Item { id } }
-    }
+        return lambda value: {"date": value}
+    if data_type == "SINGLE_SELECT":
+        options = field.get("options_by_lower") or {}
+
+        def build_option(value: str) -> Dict[str, Any]:
+            if not options:
+                raise ValueError("câmp single-select fără opțiuni; ignorat.")
+            opt_id = options.get(value.lower())
+            if not opt_id:
+                raise ValueError(f"opțiune necunoscută '{value}' pentru câmpul single-select; ignorat.")
+            return {"singleSelectOptionId": opt_id}
+        return build_option
+
+    def build_unsupported(value: str) -> Dict[str, Any]:
+        raise ValueError(f"tip de câmp nesuportat acum: {data_type}; ignor.")
+    return build_unsupported
+
+async def update_fields(client: httpx.AsyncClient, token: str, project_id: str, item_id: str,
+                        updates: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Setează toate câmpurile unui item (perechi (field_id, valoare)) într-un singur request.
+
+    Mutațiile din același document sunt executate în ordine de GitHub.
     """
-    gql(token, m, {"input": {
-        "projectId": project_id,
-        "itemId": item_id,
-        "fieldId": field_id,
-        "value": val
-    }})
-
-def create_draft_issue_and_item(token: str, project_id: str, title: str, body: str,
-                                assignee_ids: List[str]) -> str:
-    m = """
-    mutation($input:AddProjectV2DraftIssueInput!){
-      addProjectV2DraftIssue(input:$input){
-        projectItem { id }
-      }
-    }
-    """
-    d = gql(token, m, {"input": {
+    if not updates:
+        return
+    defs = ["$p:ID!", "$i:ID!"]
+    selections = []
+    variables: Dict[str, Any] = {"p": project_id, "i": item_id}
+    for n, (field_id, val) in enumerate(updates):
+        defs.append(f"$f{n}:ID!, $v{n}:ProjectV2FieldValue!")
+        selections.append(M_UPDATE_FIELD.format(n=n))
+        variables[f"f{n}"] = field_id
+        variables[f"v{n}"] = val
+    m = f"mutation({', '.join(defs)}) {{\n  " + "\n  ".join(selections) + "\n}"
+    await gql(client, token, m, variables)
+
+async def update_field(client: httpx.AsyncClient, token: str, project_id: str, item_id: str,
+                       field_id: str, val: Dict[str, Any]) -> None:
+    # un singur câmp, cu valoarea deja construită de field["build_value"]
+    await update_fields(client, token, project_id, item_id, [(field_id, val)])
+
+async def create_draft_issue_and_item(client: httpx.AsyncClient, token: str, project_id: str,
+                                      title: str, body: str, assignee_ids: List[str]) -> str:
+    d = await gql(client, token, M_DRAFT_ISSUE, {"input": {
         "projectId": project_id,
         "title": title,
         "body": body or "",
         "assigneeIds": assignee_ids or None
-    }})
+    }}, idempotent=False)
     return d["addProjectV2DraftIssue"]["projectItem"]["id"]
 
 
-def main():
+RESERVED_COLUMNS = {"Title", "title", "Body", "body", "Labels", "labels", "Assignees", "assignees"}
+
+def reserved_column_indexes(header: List[str]) -> Dict[str, Optional[int]]:
+    """Poziția coloanelor Title/Body/Labels/Assignees, detectată o singură dată din header
+    (varianta TitleCase are prioritate față de lowercase)."""
+    header_idx = {h: n for n, h in enumerate(header)}
+    return {
+        key: header_idx.get(key.capitalize(), header_idx.get(key))
+        for key in ("title", "body", "labels", "assignees")
+    }
+
+def cell(row: List[str], n: Optional[int]) -> str:
+    return row[n] if n is not None and n < len(row) else ""
+
+@lru_cache(maxsize=4096)
+def split_csv_list(raw: str) -> Tuple[str, ...]:
+    # aceleași celule (ex: echipa de assignees) se repetă pe multe rânduri
+    return tuple(x.strip() for x in raw.split(",") if x.strip())
+
+@lru_cache(maxsize=4096)
+def split_assignees(raw: str) -> Tuple[str, ...]:
+    return tuple(x for x in (lg.lstrip("@") for lg in split_csv_list(raw)) if x)
+
+async def process_row(client: httpx.AsyncClient, sem: asyncio.Semaphore, row: List[str], i: int,
+                      token: str, project_id: str, reserved: Dict[str, Optional[int]],
+                      col_meta: List[Optional[Dict[str, Any]]], repo_id: Optional[str],
+                      args: argparse.Namespace) -> bool:
+    """Importă un rând; întoarce False dacă rândul a eșuat (eroarea e deja raportată)."""
+    title = cell(row, reserved["title"])
+    if not title:
+        # ca înainte, rândurile fără Title sunt doar sărite
+        log.error("Linia %d: lipsește coloana Title.", i)
+        return True
+    body = cell(row, reserved["body"])
+
+    labels = split_csv_list(cell(row, reserved["labels"]))
+    assignees = split_assignees(cell(row, reserved["assignees"]))
+
+    # cel mult --concurrency rânduri au request-uri în zbor în același timp
+    async with sem:
+        # o eroare pe un rând nu trebuie să oprească (și să anuleze) celelalte rânduri
+        try:
+            assignee_ids = await get_user_ids(client, token, assignees, i)
+
+            if args.draft:
+                # Create Draft Issue directly in Project
+                item_id = await create_draft_issue_and_item(client, token, project_id, title, body,
+                                                            assignee_ids)
+                log.info("Linia %d: Draft Issue creat și adăugat în Project (item %s).", i, item_id)
+            else:
+                # Create Issue in repo, added to Project by the same mutation
+                label_ids = await get_label_ids(client, token, args.repo, labels, i)
+                item_id = await create_issue_and_item(client, token, repo_id, project_id, title, body,
+                                                      label_ids, assignee_ids, i)
+                log.info("Linia %d: adăugat în Project item %s.", i, item_id)
+
+            # Setează câmpuri de Project pe baza coloanelor suplimentare,
+            # toate mutațiile rândului într-un singur request (se execută în ordine)
+            updates = []
+            cells = []
+            for field, col_val in zip(col_meta, row):
+                # None = coloană rezervată sau care nu corespunde unui câmp din Project
+                if field is None:
+                    continue
+                col_val = col_val.strip()
+                if not col_val:
+                    continue
+                try:
+                    val = field["build_value"](col_val)
+                except ValueError as e:
+                    log.warning("Linia %d, coloana '%s': %s", i, field["name"], e)
+                    continue
+                updates.append((field["id"], val))
+                cells.append((field["name"], col_val))
+            try:
+                await update_fields(client, token, project_id, item_id, updates)
+            except GraphQLError as e:
+                if len(updates) == 1:
+                    log.warning("Linia %d: nu am putut seta câmpul '%s' la '%s': %s", i, *cells[0], e)
+                else:
+                    # GitHub respinge tot documentul dacă o singură valoare e invalidă (ex: o dată
+                    # greșită); reîncercăm câmp cu câmp ca să pierdem doar celula problematică.
+                    # Erorile de rețea / rate limit nu ajung aici și opresc rândul.
+                    for (field_id, val), (col_name, col_val) in zip(updates, cells):
+                        try:
+                            await update_field(client, token, project_id, item_id, field_id, val)
+                        except GraphQLError as e:
+                            log.warning("Linia %d: nu am putut seta câmpul '%s' la '%s': %s", i, col_name, col_val, e)
+        except Exception as e:
+            log.error("Linia %d: %s", i, e)
+            return False
+    return True
+
+
+async def main():
     ap = argparse.ArgumentParser(description="Import CSV ca task-uri în GitHub Project (v2)")
     ap.add_argument("--token", help="GitHub token (sau setează env GITHUB_TOKEN)")
     ap.add_argument("--project-owner", required=True, help="Owner (org sau user) al Project-ului, ex: my-org sau my-user")
@@ -258,74 +561,54 @@ def main():
     ap.add_argument("--repo", help="Repo în care se creează issues, ex: org/repo (dacă lipsește și folosești --draft, vor fi Draft Issues)")
     ap.add_argument("--delimiter", default=",", help="Delimiter CSV (default ,)")
     ap.add_argument("--draft", action="store_true", help="Creează Draft Issues în Project în loc de Issues în repo")
-    ap.add_argument("--rate-sleep", type=float, default=0.25, help="Pauză între mutații (sec)")
+    ap.add_argument("--rate-sleep", type=float, default=0.0,
+                    help="Pauză minimă între request-uri (sec); implicit 0, ritmul e dat de rate limit-ul GitHub")
+    ap.add_argument("--concurrency", type=int, default=8,
+                    help="Câte rânduri se procesează în paralel (default 8; 1 păstrează ordinea din CSV)")
     args = ap.parse_args()
+    if args.concurrency < 1:
+        ap.error("--concurrency trebuie să fie cel puțin 1")
+    setup_logging()
 
     token = args.token or os.getenv("GITHUB_TOKEN")
     if not token:
-        print("Lipsește token-ul. Folosește --token sau variabila de mediu GITHUB_TOKEN.", file=sys.stderr)
+        log.error("Lipsește token-ul. Folosește --token sau variabila de mediu GITHUB_TOKEN.")
+        sys.exit(1)
+    if not args.draft and not args.repo:
+        log.error("Pentru mod non-draft trebuie să specifici --repo (ex: org/repo). Sau folosește --draft.")
         sys.exit(1)
 
-    project = get_project_and_fields(token, args.project_owner, args.project_number)
-    project_id = project["id"]
-    project_fields: Dict[str, Any] = project["fields"]
-
-    repo_id = None
-    if not args.draft:
-        if not args.repo:
-            print("Pentru mod non-draft trebuie să specifici --repo (ex: org/repo). Sau folosește --draft.", file=sys.stderr)
-            sys.exit(1)
-        repo_id = get_repo_id(token, args.repo)
-
-    with open(args.csv, newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f, delimiter=args.delimiter)
-        required = None
-        for i, row in enumerate(reader, start=1):
-            title = row.get("Title") or row.get("title")
-            if not title:
-                print(f"[EROARE] Linia {i}: lipsește coloana Title.", file=sys.stderr)
-                continue
-            body = row.get("Body") or row.get("body") or ""
-
-            labels_raw = row.get("Labels") or row.get("labels") or ""
-            labels = [x.strip() for x in labels_raw.split(",")] if labels_raw else []
-
-            assignees_raw = row.get("Assignees") or row.get("assignees") or ""
-            assignees = [x.strip().lstrip("@") for x in assignees_raw.split(",")] if assignees_raw else []
-
-            assignee_ids = get_user_ids(token, assignees)
-
-            if args.draft:
-                # Create Draft Issue directly in Project
-                item_id = create_draft_issue_and_item(token, project_id, title, body, assignee_ids)
-                print(f"Draft Issue creat și adăugat în Project (item {item_id}).")
-            else:
-                # Create Issue in repo, then add it to Project
-                label_ids = get_label_ids(token, args.repo, labels)
-                issue_id = create_issue(token, repo_id, title, body, label_ids, assignee_ids)
-                item_id = add_item_to_project(token, project_id, issue_id)
-                print(f"Adăugat în Project item {item_id}.")
-
-            # Setează câmpuri de Project pe baza coloanelor suplimentare
-            for col_name, col_val in row.items():
-                if col_name in ("Title", "title", "Body", "body", "Labels", "labels", "Assignees", "assignees"):
-                    continue
-                if col_val is None or str(col_val).strip() == "":
-                    continue
-                field = project_fields.get(col_name)
-                if not field:
-                    # ignoră coloane care nu corespund câmpurilor din Project
-                    continue
-                options = None
-                if field["dataType"] == "SINGLE_SELECT":
-                    options = field.get("options") or []
-                try:
-                    update_field(token, project_id, item_id, field["id"], field["dataType"], str(col_val).strip(), options)
-                except Exception as e:
-                    print(f"[AVERTISMENT] Nu am putut seta câmpul '{col_name}' la '{col_val}': {e}", file=sys.stderr)
-
-            time.sleep(args.rate_sleep)
+    RATE_LIMITER.min_interval = args.rate_sleep
+
+    async with make_client() as client:
+        project = await get_project_and_fields(client, token, args.project_owner, args.project_number)
+        project_id = project["id"]
+        project_fields: Dict[str, Any] = project["fields"]
+
+        repo_id = None
+        if not args.draft:
+            repo_id = await get_repo_id(client, token, args.repo)
+            await load_repo_labels(client, token, args.repo)
+
+        with open(args.csv, newline="", encoding="utf-8") as f:
+            reader = csv.reader(f, delimiter=args.delimiter)
+            header = next(reader, [])
+            # ca la DictReader, rândurile complet goale sunt sărite
+            rows = [r for r in reader if r]
+        # pozițiile coloanelor rezervate și câmpul de Project țintă se calculează o singură dată
+        reserved = reserved_column_indexes(header)
+        col_meta = [None if h in RESERVED_COLUMNS else project_fields.get(h) for h in header]
+
+        sem = asyncio.Semaphore(args.concurrency)
+        results = await asyncio.gather(*(
+            process_row(client, sem, row, i, token, project_id, reserved, col_meta, repo_id, args)
+            for i, row in enumerate(rows, start=1)
+        ))
+
+    failed = results.count(False)
+    if failed:
+        log.error("%d din %d rânduri nu au putut fi importate.", failed, len(results))
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
-
+    asyncio.run(main())